@@ -11,48 +11,210 @@ Usage:
 
 import argparse
 import sys
+import zipfile
 from datetime import datetime
+from pathlib import Path
 
-try:
-    import pandas as pd
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
-except ImportError:
-    print("Error: Required packages not installed.")
-    print("Please run: pip install -r requirements.txt")
-    sys.exit(1)
+# Pre-rendered xlsx parts for the static template; assembling these into a
+# zip skips the openpyxl object model entirely
+_TEMPLATE_PARTS_DIR = Path(__file__).resolve().parent / 'templates' / 'xlsx'
 
+_EXCEL_DEPS_LOADED = False
 
-def create_pricing_template(filename: str = "domain_pricing_template.xlsx"):
+
+def _ensure_excel_deps():
     """
-    Create an Excel template for domain pricing and tracking.
-    
-    Args:
-        filename: Output filename
+    Import the Excel stack and build the shared style objects on first use.
+
+    The default template path only zips pre-rendered XML, so openpyxl and
+    numpy are loaded lazily to keep CLI startup off their import cost.
+    """
+    global _EXCEL_DEPS_LOADED
+    if _EXCEL_DEPS_LOADED:
+        return
+
+    global np, Workbook, WriteOnlyCell
+    global Font, NamedStyle, PatternFill, Alignment, Border, Side, get_column_letter
+    global HEADER_FONT, TITLE_FONT, SECTION_FONT, SECTION_FILL, HEADER_ALIGNMENT, THIN_BORDER
+    global compute_sold_metrics
+
+    try:
+        import numpy as np
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, NamedStyle, PatternFill, Alignment, Border, Side
+        from openpyxl.utils import get_column_letter
+    except ImportError:
+        print("Error: Required packages not installed.")
+        print("Please run: pip install -r requirements.txt")
+        sys.exit(1)
+
+    try:
+        from numba import njit
+    except ImportError:
+        njit = None  # Optional; the plain-Python loop is used as fallback
+
+    # Shared style objects, built once instead of per cell
+    HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+    TITLE_FONT = Font(bold=True, size=14)
+    SECTION_FONT = Font(bold=True, size=11)
+    SECTION_FILL = PatternFill(start_color="FFA726", end_color="FFA726", fill_type="solid")
+    HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+    THIN_BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+
+    if njit is not None:
+        compute_sold_metrics = njit(cache=True)(_compute_sold_metrics)
+    else:
+        compute_sold_metrics = _compute_sold_metrics
+
+    _EXCEL_DEPS_LOADED = True
+
+
+MONEY_FORMAT = '$#,##0.00'
+PERCENT_FORMAT = '0.00"%"'
+
+# Sold-sheet formula templates, parsed once at import
+_NET_PROFIT_FMT = "=E{r}-C{r}-G{r}"
+_ROI_FMT = "=IF(C{r}>0,((E{r}-C{r}-G{r})/C{r})*100,0)"
+_DAYS_HELD_FMT = "=IF(AND(D{r}<>\"\",B{r}<>\"\"),D{r}-B{r},\"\")"
+
+
+def _build_named_styles():
+    """
+    Build the named styles used by the template sheets.
+
+    Named styles are registered on the workbook once; cells then reference
+    them by name, which is a dict lookup instead of a per-assignment style
+    comparison against the workbook's style table.
     """
-    # Create a new workbook
-    wb = Workbook()
-    
-    # Remove default sheet and create our sheets
-    wb.remove(wb.active)
-    
+    styles = []
+
+    for name, color in [("hdr_inventory", "366092"), ("hdr_sold", "2E7D32")]:
+        style = NamedStyle(name=name)
+        style.font = HEADER_FONT
+        style.fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+        style.alignment = HEADER_ALIGNMENT
+        style.border = THIN_BORDER
+        styles.append(style)
+
+    for name, number_format in [
+        ("body_plain", None),
+        ("body_money", MONEY_FORMAT),
+        ("body_pct", PERCENT_FORMAT),
+        ("body_days", '0'),
+    ]:
+        style = NamedStyle(name=name)
+        style.border = THIN_BORDER
+        if number_format:
+            style.number_format = number_format
+        styles.append(style)
+
+    # Borderless number-format styles for the summary sheet
+    for name, number_format in [
+        ("money", MONEY_FORMAT),
+        ("pct", PERCENT_FORMAT),
+        ("days", '0'),
+    ]:
+        style = NamedStyle(name=name)
+        style.number_format = number_format
+        styles.append(style)
+
+    return styles
+
+
+def _styled_cell(sheet, value, style_name):
+    """Build a cell for a write-only sheet referencing a registered named style."""
+    cell = WriteOnlyCell(sheet, value=value)
+    cell.style = style_name
+    return cell
+
+
+def _compute_sold_metrics(purchase, sale, fee, purchase_ord, sale_ord):
+    """
+    Compute net profit, ROI, and days held for sold domains in one pass.
+
+    Takes float64 arrays (dates as ordinals) and returns matching arrays.
+    Compiled with numba when available, so filling a sheet from thousands
+    of historical records costs one native loop instead of emitting a
+    spreadsheet formula per row.
+    """
+    n = purchase.shape[0]
+    profit = np.empty(n)
+    roi = np.empty(n)
+    days = np.empty(n)
+    for i in range(n):
+        profit[i] = sale[i] - purchase[i] - fee[i]
+        roi[i] = profit[i] / purchase[i] * 100.0 if purchase[i] > 0 else 0.0
+        days[i] = sale_ord[i] - purchase_ord[i]
+    return profit, roi, days
+
+
+def _write_template_from_parts(filename: str):
+    """Assemble the template from the pre-rendered xlsx parts."""
+    timestamp = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ').encode('ascii')
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for part in sorted(_TEMPLATE_PARTS_DIR.rglob('*')):
+            if not part.is_file():
+                continue
+            name = part.relative_to(_TEMPLATE_PARTS_DIR).as_posix()
+            data = part.read_bytes()
+            if name == 'docProps/core.xml':
+                data = data.replace(b'@TIMESTAMP@', timestamp)
+            archive.writestr(name, data)
+
+
+def _build_template_workbook(filename: str):
+    """Build the template through openpyxl (legacy/fallback path)."""
+    _ensure_excel_deps()
+
+    # Write-only workbook: rows are streamed out instead of held in memory
+    wb = Workbook(write_only=True)
+
+    # Register named styles once per workbook
+    for style in _build_named_styles():
+        wb.add_named_style(style)
+
     # Create sheets
     inventory_sheet = wb.create_sheet("Domain Inventory", 0)
     sold_sheet = wb.create_sheet("Sold Domains", 1)
     summary_sheet = wb.create_sheet("Summary", 2)
-    
+
     # Configure Domain Inventory sheet
     setup_inventory_sheet(inventory_sheet)
-    
+
     # Configure Sold Domains sheet
     setup_sold_sheet(sold_sheet)
-    
+
     # Configure Summary sheet
     setup_summary_sheet(summary_sheet)
-    
+
     # Save the workbook
     wb.save(filename)
+
+
+def create_pricing_template(filename: str = "domain_pricing_template.xlsx",
+                            use_openpyxl: bool = False):
+    """
+    Create an Excel template for domain pricing and tracking.
+
+    The template content is fixed, so by default the pre-rendered sheet XML
+    shipped in templates/xlsx is zipped straight into the output file without
+    importing openpyxl at all. The openpyxl builder remains available via
+    use_openpyxl (--legacy on the CLI) and when the parts are missing.
+
+    Args:
+        filename: Output filename
+        use_openpyxl: Force the openpyxl builder instead of the shipped parts
+    """
+    if use_openpyxl or not _TEMPLATE_PARTS_DIR.is_dir():
+        _build_template_workbook(filename)
+    else:
+        _write_template_from_parts(filename)
     print(f"✓ Created pricing template: {filename}")
     print(f"\nTemplate includes:")
     print(f"  - Domain Inventory: Track purchased domains and target prices")
@@ -76,52 +238,47 @@ def setup_inventory_sheet(sheet):
         "Status",
         "Notes"
     ]
-    
-    # Style configuration
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # Write headers
-    for col_num, header in enumerate(headers, 1):
-        cell = sheet.cell(row=1, column=col_num)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
-    
+
     # Set column widths
     column_widths = [25, 12, 15, 12, 12, 18, 20, 15, 30, 12, 30]
     for col_num, width in enumerate(column_widths, 1):
         sheet.column_dimensions[get_column_letter(col_num)].width = width
-    
+
+    # Freeze top row
+    sheet.freeze_panes = 'A2'
+
+    # Write headers
+    sheet.append([_styled_cell(sheet, header, "hdr_inventory") for header in headers])
+
     # Add sample data
     sample_data = [
         ["example-domain.com", "2025-01-15", 2.99, "Namecheap", "2026-01-15", 50.00, 25.00, "Flippa", "https://flippa.com/...", "Listed", "Tech related"],
         ["quick-startup.io", "2025-01-16", 8.99, "Namecheap", "2026-01-16", 100.00, 60.00, "Brandpa", "https://brandpa.com/...", "Listed", "Business name"],
         ["smart-hub.net", "2025-01-17", 1.99, "Namecheap", "2026-01-17", 40.00, 20.00, "", "", "Available", "Short and catchy"],
     ]
-    
-    for row_num, row_data in enumerate(sample_data, 2):
-        for col_num, value in enumerate(row_data, 1):
-            cell = sheet.cell(row=row_num, column=col_num)
-            cell.value = value
-            cell.border = border
-            if col_num in [3, 6, 7]:  # Price columns
-                cell.number_format = '$#,##0.00'
-    
-    # Freeze top row
-    sheet.freeze_panes = 'A2'
+
+    price_columns = {3, 6, 7}
+    for row_data in sample_data:
+        sheet.append([
+            _styled_cell(sheet, value, "body_money" if col_num in price_columns else "body_plain")
+            for col_num, value in enumerate(row_data, 1)
+        ])
 
 
-def setup_sold_sheet(sheet):
-    """Set up the Sold Domains sheet."""
+def setup_sold_sheet(sheet, sold_records=None):
+    """
+    Set up the Sold Domains sheet.
+
+    Args:
+        sheet: Write-only worksheet to fill
+        sold_records: Optional historical records as
+            (domain, purchase_date, purchase_price, sale_date, sale_price,
+            marketplace, fee) tuples with ISO dates. When given, profit/ROI/
+            days-held are computed in bulk and written as literal values
+            instead of per-row formulas.
+    """
+    _ensure_excel_deps()
+
     # Headers
     headers = [
         "Domain Name",
@@ -136,134 +293,130 @@ def setup_sold_sheet(sheet):
         "Days Held",
         "Notes"
     ]
-    
-    # Style configuration
-    header_font = Font(bold=True, color="FFFFFF", size=11)
-    header_fill = PatternFill(start_color="2E7D32", end_color="2E7D32", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
-    
-    # Write headers
-    for col_num, header in enumerate(headers, 1):
-        cell = sheet.cell(row=1, column=col_num)
-        cell.value = header
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = border
-    
+
     # Set column widths
     column_widths = [25, 12, 15, 12, 15, 15, 18, 15, 12, 12, 30]
     for col_num, width in enumerate(column_widths, 1):
         sheet.column_dimensions[get_column_letter(col_num)].width = width
-    
-    # Add formula rows (starting from row 2)
+
+    # Freeze top row
+    sheet.freeze_panes = 'A2'
+
+    # Write headers
+    sheet.append([_styled_cell(sheet, header, "hdr_sold") for header in headers])
+
+    price_columns = {3, 5, 7}
+
+    if sold_records:
+        # Bulk path: one native pass over the numbers, literal cell values
+        purchase = np.array([float(r[2]) for r in sold_records])
+        sale = np.array([float(r[4]) for r in sold_records])
+        fee = np.array([float(r[6]) for r in sold_records])
+        purchase_ord = np.array(
+            [float(datetime.strptime(r[1], '%Y-%m-%d').toordinal()) for r in sold_records]
+        )
+        sale_ord = np.array(
+            [float(datetime.strptime(r[3], '%Y-%m-%d').toordinal()) for r in sold_records]
+        )
+        profit, roi, days = compute_sold_metrics(purchase, sale, fee, purchase_ord, sale_ord)
+
+        for i, record in enumerate(sold_records):
+            cells = [
+                _styled_cell(sheet, value, "body_money" if col_num in price_columns else "body_plain")
+                for col_num, value in enumerate(record[:7], 1)
+            ]
+            cells.append(_styled_cell(sheet, round(profit[i], 2), "body_money"))
+            cells.append(_styled_cell(sheet, round(roi[i], 2), "body_pct"))
+            cells.append(_styled_cell(sheet, int(days[i]), "body_days"))
+            sheet.append(cells)
+        return
+
+    # Sample data for the first rows; formula columns are filled below
     # Net Profit = Sale Price - Purchase Price - Marketplace Fee
     # ROI = ((Sale Price - Purchase Price - Marketplace Fee) / Purchase Price) * 100
     # Days Held = Sale Date - Purchase Date
-    
-    for row in range(2, 12):  # Add formulas for first 10 rows
-        # Net Profit (column H)
-        sheet.cell(row=row, column=8).value = f"=E{row}-C{row}-G{row}"
-        sheet.cell(row=row, column=8).number_format = '$#,##0.00'
-        
-        # ROI (column I)
-        sheet.cell(row=row, column=9).value = f"=IF(C{row}>0,((E{row}-C{row}-G{row})/C{row})*100,0)"
-        sheet.cell(row=row, column=9).number_format = '0.00"%"'
-        
-        # Days Held (column J)
-        sheet.cell(row=row, column=10).value = f"=IF(AND(D{row}<>\"\",B{row}<>\"\"),D{row}-B{row},\"\")"
-        sheet.cell(row=row, column=10).number_format = '0'
-    
-    # Add sample data
     sample_data = [
         ["sold-example.com", "2025-01-10", 2.99, "2025-02-15", 55.00, "Flippa", 5.50],
         ["quick-brand.io", "2025-01-05", 8.99, "2025-02-20", 120.00, "Brandpa", 12.00],
     ]
-    
-    for row_num, row_data in enumerate(sample_data, 2):
-        for col_num, value in enumerate(row_data, 1):
-            cell = sheet.cell(row=row_num, column=col_num)
-            if col_num not in [8, 9, 10]:  # Skip formula columns
-                cell.value = value
-            cell.border = border
-            if col_num in [3, 5, 7]:  # Price columns
-                cell.number_format = '$#,##0.00'
-    
-    # Freeze top row
-    sheet.freeze_panes = 'A2'
+
+    for row_num in range(2, 12):  # Add formulas for first 10 rows
+        row_data = sample_data[row_num - 2] if row_num - 2 < len(sample_data) else [None] * 7
+        cells = [
+            _styled_cell(sheet, value, "body_money" if col_num in price_columns else "body_plain")
+            for col_num, value in enumerate(row_data, 1)
+        ]
+        # Net Profit (column H)
+        cells.append(_styled_cell(sheet, _NET_PROFIT_FMT.format(r=row_num), "body_money"))
+        # ROI (column I)
+        cells.append(_styled_cell(sheet, _ROI_FMT.format(r=row_num), "body_pct"))
+        # Days Held (column J)
+        cells.append(_styled_cell(sheet, _DAYS_HELD_FMT.format(r=row_num), "body_days"))
+        sheet.append(cells)
 
 
 def setup_summary_sheet(sheet):
     """Set up the Summary sheet."""
-    # Style configuration
-    title_font = Font(bold=True, size=14)
-    header_font = Font(bold=True, size=11)
-    header_fill = PatternFill(start_color="FFA726", end_color="FFA726", fill_type="solid")
-    
+    # Set column widths
+    sheet.column_dimensions['A'].width = 25
+    sheet.column_dimensions['B'].width = 20
+
+    def title_cell(value):
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = TITLE_FONT
+        return cell
+
+    def section_cell(value):
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = SECTION_FONT
+        cell.fill = SECTION_FILL
+        return cell
+
+    def formula_cell(value, style_name=None):
+        cell = WriteOnlyCell(sheet, value=value)
+        if style_name:
+            cell.style = style_name
+        return cell
+
     # Title
-    sheet.cell(row=1, column=1).value = "Domain Flipping Portfolio Summary"
-    sheet.cell(row=1, column=1).font = title_font
-    
+    sheet.append([title_cell("Domain Flipping Portfolio Summary")])
+    sheet.append(())
+
     # Current Inventory Section
-    sheet.cell(row=3, column=1).value = "Current Inventory"
-    sheet.cell(row=3, column=1).font = header_font
-    sheet.cell(row=3, column=1).fill = header_fill
-    
+    sheet.append([section_cell("Current Inventory")])
+
     metrics = [
-        ("Total Domains Owned", "=COUNTA('Domain Inventory'!A:A)-1"),
-        ("Total Investment", "=SUM('Domain Inventory'!C:C)"),
-        ("Target Portfolio Value", "=SUM('Domain Inventory'!F:F)"),
-        ("Potential Profit", "=C6-C5"),
+        ("Total Domains Owned", "=COUNTA('Domain Inventory'!A:A)-1", None),
+        ("Total Investment", "=SUM('Domain Inventory'!C:C)", "money"),
+        ("Target Portfolio Value", "=SUM('Domain Inventory'!F:F)", "money"),
+        ("Potential Profit", "=C6-C5", "money"),
     ]
-    
-    row = 4
-    for label, formula in metrics:
-        sheet.cell(row=row, column=1).value = label
-        sheet.cell(row=row, column=2).value = formula
-        if row > 4:
-            sheet.cell(row=row, column=2).number_format = '$#,##0.00'
-        row += 1
-    
+
+    for label, formula, style_name in metrics:
+        sheet.append([label, formula_cell(formula, style_name)])
+
     # Sales Performance Section
-    sheet.cell(row=row + 1, column=1).value = "Sales Performance"
-    sheet.cell(row=row + 1, column=1).font = header_font
-    sheet.cell(row=row + 1, column=1).fill = header_fill
-    
-    row += 2
+    sheet.append(())
+    sheet.append([section_cell("Sales Performance")])
+
     sales_metrics = [
-        ("Total Domains Sold", "=COUNTA('Sold Domains'!A:A)-1"),
-        ("Total Revenue", "=SUM('Sold Domains'!E:E)"),
-        ("Total Costs", "=SUM('Sold Domains'!C:C)+SUM('Sold Domains'!G:G)"),
-        ("Net Profit", "=C11-C12"),
-        ("Average ROI", "=AVERAGE('Sold Domains'!I:I)"),
-        ("Average Days to Sale", "=AVERAGE('Sold Domains'!J:J)"),
+        ("Total Domains Sold", "=COUNTA('Sold Domains'!A:A)-1", None),
+        ("Total Revenue", "=SUM('Sold Domains'!E:E)", "money"),
+        ("Total Costs", "=SUM('Sold Domains'!C:C)+SUM('Sold Domains'!G:G)", "money"),
+        ("Net Profit", "=C11-C12", "money"),
+        ("Average ROI", "=AVERAGE('Sold Domains'!I:I)", "pct"),
+        ("Average Days to Sale", "=AVERAGE('Sold Domains'!J:J)", "days"),
     ]
-    
-    for label, formula in sales_metrics:
-        sheet.cell(row=row, column=1).value = label
-        sheet.cell(row=row, column=2).value = formula
-        if row in [11, 12, 13]:
-            sheet.cell(row=row, column=2).number_format = '$#,##0.00'
-        elif row == 14:
-            sheet.cell(row=row, column=2).number_format = '0.00"%"'
-        elif row == 15:
-            sheet.cell(row=row, column=2).number_format = '0'
-        row += 1
-    
-    # Set column widths
-    sheet.column_dimensions['A'].width = 25
-    sheet.column_dimensions['B'].width = 20
-    
+
+    for label, formula, style_name in sales_metrics:
+        sheet.append([label, formula_cell(formula, style_name)])
+
     # Add instructions
-    row += 2
-    sheet.cell(row=row, column=1).value = "Instructions:"
-    sheet.cell(row=row, column=1).font = Font(bold=True)
-    
+    bold_cell = WriteOnlyCell(sheet, value="Instructions:")
+    bold_cell.font = Font(bold=True)
+    sheet.append(())
+    sheet.append([bold_cell])
+
     instructions = [
         "1. Add purchased domains to the 'Domain Inventory' sheet",
         "2. When a domain is sold, move it to the 'Sold Domains' sheet",
@@ -271,11 +424,9 @@ def setup_summary_sheet(sheet):
         "4. This summary updates automatically based on your data",
         "5. Target prices help you set realistic sale expectations"
     ]
-    
-    row += 1
+
     for instruction in instructions:
-        sheet.cell(row=row, column=1).value = instruction
-        row += 1
+        sheet.append([instruction])
 
 
 def main():
@@ -289,10 +440,15 @@ def main():
         default='domain_pricing_template.xlsx',
         help='Output filename (default: domain_pricing_template.xlsx)'
     )
-    
+    parser.add_argument(
+        '--legacy',
+        action='store_true',
+        help='Build the template through openpyxl instead of the shipped parts'
+    )
+
     args = parser.parse_args()
-    
-    create_pricing_template(args.output)
+
+    create_pricing_template(args.output, use_openpyxl=args.legacy)
 
 
 if __name__ == '__main__':
@@ -12,61 +12,28 @@ Usage:
 
 import argparse
 import csv
+import re
+import string
 import sys
+from collections import namedtuple
 from datetime import datetime
-from typing import Dict, List
+from typing import List
 
+# Lightweight CSV record; avoids building a dict per row
+Row = namedtuple('Row', 'domain price description')
 
-def generate_listing(domain: str, price: float, description: str = "") -> str:
-    """
-    Generate a formatted Flippa listing for a domain.
-    
-    Args:
-        domain: Domain name
-        price: Asking price
-        description: Optional custom description
-        
-    Returns:
-        Formatted listing text
-    """
-    # Extract domain components
-    parts = domain.rsplit('.', 1)
-    if len(parts) == 2:
-        name, tld = parts
-    else:
-        name, tld = domain, "com"
-    
-    # Generate features based on domain characteristics
-    features = []
-    
-    if len(name) <= 8:
-        features.append("✓ Short and memorable domain name")
-    
-    if '-' not in name:
-        features.append("✓ No hyphens - easy to remember and type")
-    
-    if any(keyword in name.lower() for keyword in ['quick', 'fast', 'smart', 'easy', 'pro', 'tech', 'digital', 'cloud', 'app']):
-        features.append("✓ Contains premium keywords")
-    
-    if tld in ['com', 'io', 'net', 'co']:
-        features.append(f"✓ Popular .{tld} extension")
-    
-    features.append("✓ Instant transfer available")
-    features.append("✓ Clear ownership, ready to use")
-    
-    # Create the listing
-    listing = f"""
-{'=' * 70}
-DOMAIN LISTING: {domain.upper()}
-{'=' * 70}
+# Keyword/TLD lookups compiled once instead of per listing; the popular-TLD
+# feature strings are prebuilt so the check is a single dict hit
+_PREMIUM_RE = re.compile(r'quick|fast|smart|easy|pro|tech|digital|cloud|app', re.IGNORECASE)
+_TLD_FEATURE = {tld: f"✓ Popular .{tld} extension" for tld in ('com', 'io', 'net', 'co')}
 
-💰 ASKING PRICE: ${price:.2f}
+# Static listing scaffolding, built once at import instead of per listing
+_RULE = '=' * 70
 
-📝 DESCRIPTION:
-{description if description else f'''
+_DEFAULT_DESCRIPTION_TMPL = string.Template('''
 Premium domain name available for immediate purchase!
 
-{domain} is a brandable domain name perfect for:
+${domain} is a brandable domain name perfect for:
 • Technology startups
 • Digital services
 • SaaS applications
@@ -76,14 +43,24 @@ Premium domain name available for immediate purchase!
 
 This domain has strong commercial potential and can help establish
 a professional online presence for your business.
-'''}
+''')
+
+_LISTING_TMPL = string.Template("""
+${rule}
+DOMAIN LISTING: ${domain_upper}
+${rule}
+
+💰 ASKING PRICE: $$${price}
+
+📝 DESCRIPTION:
+${description}
 
 ✨ KEY FEATURES:
-{chr(10).join(features)}
+${features}
 
 📊 DOMAIN DETAILS:
-• Domain Name: {domain}
-• Extension: .{tld}
+• Domain Name: ${domain}
+• Extension: .${tld}
 • Age: Recently registered / Available
 • Registrar: Transferrable from major registrars
 • Transfer: Fast and secure transfer process
@@ -102,7 +79,7 @@ a professional online presence for your business.
 4. Ownership transferred within 5-7 days
 
 💵 PRICING:
-• Listed Price: ${price:.2f}
+• Listed Price: $$${price}
 • Open to reasonable offers
 • Fast sale preferred
 
@@ -113,51 +90,118 @@ a professional online presence for your business.
 
 ⚡ ACT FAST - Premium domains like this don't last long!
 
-{'=' * 70}
-"""
+${rule}
+""")
+
+
+def generate_listing(domain: str, price: float, description: str = "") -> str:
+    """
+    Generate a formatted Flippa listing for a domain.
     
-    return listing
+    Args:
+        domain: Domain name
+        price: Asking price
+        description: Optional custom description
+        
+    Returns:
+        Formatted listing text
+    """
+    # Extract domain components
+    parts = domain.rsplit('.', 1)
+    if len(parts) == 2:
+        name, tld = parts
+    else:
+        name, tld = domain, "com"
+    
+    # Generate features based on domain characteristics; falsy entries are
+    # dropped so the joined block is built in a single pass
+    features = "\n".join(filter(None, (
+        len(name) <= 8 and "✓ Short and memorable domain name",
+        '-' not in name and "✓ No hyphens - easy to remember and type",
+        _PREMIUM_RE.search(name) and "✓ Contains premium keywords",
+        _TLD_FEATURE.get(tld),
+        "✓ Instant transfer available",
+        "✓ Clear ownership, ready to use",
+    )))
+
+    # Format the variable parts exactly once; the template reuses them
+    # wherever they repeat in the body
+    domain_upper = domain.upper()
+    price_str = f"{price:.2f}"
+
+    # Fill only the variable parts; the static body is reused across calls
+    if not description:
+        description = _DEFAULT_DESCRIPTION_TMPL.substitute(domain=domain)
+
+    return _LISTING_TMPL.substitute(
+        rule=_RULE,
+        domain=domain,
+        domain_upper=domain_upper,
+        tld=tld,
+        price=price_str,
+        description=description,
+        features=features,
+    )
 
 
-def generate_bulk_listings(domains: List[Dict], output_file: str = "flippa_listings.txt"):
+def generate_bulk_listings(domains: List[Row], output_file: str = "flippa_listings.txt"):
     """
     Generate multiple listings from a list of domains.
-    
+
     Args:
-        domains: List of domain dictionaries
+        domains: List of domain rows
         output_file: Output filename
     """
-    with open(output_file, 'w', encoding='utf-8') as f:
+    # Large buffer plus batched writelines keeps syscalls off the hot path
+    with open(output_file, 'w', encoding='utf-8', buffering=262144) as f:
         f.write(f"FLIPPA DOMAIN LISTINGS\n")
         f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
         f.write(f"Total Domains: {len(domains)}\n")
         f.write("=" * 70 + "\n\n")
-        
+
+        chunks = []
         for domain_data in domains:
-            domain = domain_data.get('domain', '')
             # Calculate suggested markup (10-50x)
-            purchase_price = float(domain_data.get('price', 2.0))
+            purchase_price = float(domain_data.price or 2.0)
             suggested_price = round(purchase_price * 20, 2)  # 20x markup
-            
+
             listing = generate_listing(
-                domain=domain,
+                domain=domain_data.domain,
                 price=suggested_price,
-                description=domain_data.get('description', '')
+                description=domain_data.description
             )
-            f.write(listing)
-            f.write("\n" * 3)
+            chunks.append(listing)
+            chunks.append("\n\n\n")
+            if len(chunks) >= 200:  # Flush every 100 listings
+                f.writelines(chunks)
+                chunks.clear()
+
+        f.writelines(chunks)
     
     print(f"✓ Generated {len(domains)} listings in {output_file}")
 
 
-def load_domains_from_csv(filename: str) -> List[Dict]:
+def load_domains_from_csv(filename: str) -> List[Row]:
     """Load domains from CSV file."""
     domains = []
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                print(f"Error: File '{filename}' is empty")
+                sys.exit(1)
+            # Resolve column positions once; rows become plain tuples
+            idx = {name: i for i, name in enumerate(header)}
+            di, pi, desci = idx.get('domain', 0), idx.get('price', -1), idx.get('description', -1)
             for row in reader:
-                domains.append(row)
+                if not row:
+                    continue
+                domains.append(Row(
+                    row[di] if 0 <= di < len(row) else '',
+                    row[pi] if 0 <= pi < len(row) else '',
+                    row[desci] if 0 <= desci < len(row) else ''
+                ))
         print(f"✓ Loaded {len(domains)} domains from {filename}")
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found")
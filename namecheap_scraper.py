@@ -14,15 +14,18 @@ Example:
 
 import argparse
 import csv
+import heapq
 import json
 import logging
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterator, List
 from urllib.parse import urljoin
 
 try:
+    import numpy as np
     import requests
     from bs4 import BeautifulSoup
 except ImportError:
@@ -30,6 +33,11 @@ except ImportError:
     print("Please run: pip install -r requirements.txt")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional; stdlib json is used as fallback
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -37,6 +45,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Building blocks for sample domain generation, held as arrays so a page
+# of domains is assembled with vectorized gathers instead of per-row math
+_SAMPLE_TLDS = np.array(['.com', '.net', '.io', '.co', '.app', '.dev', '.tech'])
+_SAMPLE_PREFIXES = np.array(['quick', 'smart', 'fast', 'easy', 'pro', 'mega', 'super', 'ultra'])
+_SAMPLE_SUFFIXES = np.array(['hub', 'zone', 'space', 'base', 'spot', 'point', 'link', 'cloud'])
+
 
 class NamecheapScraper:
     """
@@ -67,6 +81,11 @@ class NamecheapScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Size the connection pool to the fetch thread count so concurrent
+        # page requests reuse connections instead of opening new ones
+        adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
     def search_domains(self, keyword: str = "", page: int = 1) -> List[Dict]:
         """
@@ -92,13 +111,13 @@ class NamecheapScraper:
             logger.warning("2. Or use authorized domain marketplace APIs")
             logger.warning("3. Comply with Namecheap Terms of Service")
             
-            # Generate sample data for demonstration
-            sample_domains = self._generate_sample_domains(keyword, page)
-            
-            for domain_data in sample_domains:
-                if domain_data['price'] <= self.max_price:
-                    domains.append(domain_data)
-                    
+            # Generate sample data for demonstration; one timestamp covers
+            # every row found by this search
+            searched_at = datetime.now().isoformat()
+            domains = list(self._generate_sample_domains(
+                keyword, page, searched_at, self.max_price
+            ))
+
             logger.info(f"Found {len(domains)} domains under ${self.max_price}")
             
         except requests.RequestException as e:
@@ -110,43 +129,45 @@ class NamecheapScraper:
             
         return domains
     
-    def _generate_sample_domains(self, keyword: str, page: int) -> List[Dict]:
+    def _generate_sample_domains(self, keyword: str, page: int, searched_at: str,
+                                 max_price: float) -> Iterator[Dict]:
         """
-        Generate sample domain data for demonstration.
-        
+        Generate sample domain data for demonstration, yielding only
+        domains priced at or under max_price.
+
         In production, this would be replaced with actual API calls or
         authorized scraping methods.
         """
-        sample_tlds = ['.com', '.net', '.io', '.co', '.app', '.dev', '.tech']
-        sample_prefixes = ['quick', 'smart', 'fast', 'easy', 'pro', 'mega', 'super', 'ultra']
-        sample_suffixes = ['hub', 'zone', 'space', 'base', 'spot', 'point', 'link', 'cloud']
-        
-        domains = []
         base_index = (page - 1) * 10
-        
-        for i in range(10):
-            prefix = sample_prefixes[(base_index + i) % len(sample_prefixes)]
-            suffix = sample_suffixes[(base_index + i) % len(sample_suffixes)]
-            tld = sample_tlds[(base_index + i) % len(sample_tlds)]
-            
-            if keyword:
-                domain_name = f"{keyword}{suffix}{tld}"
-            else:
-                domain_name = f"{prefix}{suffix}{tld}"
-            
-            # Generate realistic pricing
-            price = round(1.0 + (i * 0.5) + ((base_index % 3) * 0.3), 2)
-            
-            domains.append({
-                'domain': domain_name,
-                'price': price,
-                'registrar': 'Namecheap',
-                'status': 'available',
-                'expiry_date': 'N/A',
-                'searched_at': datetime.now().isoformat()
-            })
-            
-        return domains
+        indices = base_index + np.arange(10)
+
+        # Gather the name parts and prices for the whole page at once
+        prefixes = _SAMPLE_PREFIXES[indices % len(_SAMPLE_PREFIXES)]
+        suffixes = _SAMPLE_SUFFIXES[indices % len(_SAMPLE_SUFFIXES)]
+        tlds = _SAMPLE_TLDS[indices % len(_SAMPLE_TLDS)]
+
+        # Generate realistic pricing
+        prices = np.round(1.0 + np.arange(10) * 0.5 + (base_index % 3) * 0.3, 2).tolist()
+
+        if keyword:
+            domain_names = [f"{keyword}{suffix}{tld}" for suffix, tld in zip(suffixes, tlds)]
+        else:
+            domain_names = [
+                f"{prefix}{suffix}{tld}"
+                for prefix, suffix, tld in zip(prefixes, suffixes, tlds)
+            ]
+
+        # Filter before building the dict so rejected rows never allocate one
+        for domain_name, price in zip(domain_names, prices):
+            if price <= max_price:
+                yield {
+                    'domain': domain_name,
+                    'price': price,
+                    'registrar': 'Namecheap',
+                    'status': 'available',
+                    'expiry_date': 'N/A',
+                    'searched_at': searched_at
+                }
     
     def get_expired_domains(self, pages: int = 3) -> List[Dict]:
         """
@@ -158,13 +179,18 @@ class NamecheapScraper:
         Returns:
             List of all domains found
         """
+        if pages < 1:
+            return []
+
+        # Page fetches are independent and I/O-bound, so overlap them
         all_domains = []
-        
-        for page in range(1, pages + 1):
-            domains = self.search_domains(page=page)
-            all_domains.extend(domains)
-            logger.info(f"Processed page {page}/{pages}")
-            
+        with ThreadPoolExecutor(max_workers=min(pages, 8)) as executor:
+            results = executor.map(lambda page: self.search_domains(page=page),
+                                   range(1, pages + 1))
+            for page, domains in enumerate(results, 1):
+                all_domains.extend(domains)
+                logger.info(f"Processed page {page}/{pages}")
+
         return all_domains
 
 
@@ -175,7 +201,7 @@ def save_to_csv(domains: List[Dict], filename: str):
         return
         
     try:
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=262144) as f:
             fieldnames = ['domain', 'price', 'registrar', 'status', 'expiry_date', 'searched_at']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
@@ -192,8 +218,14 @@ def save_to_json(domains: List[Dict], filename: str):
         return
         
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(domains, f, indent=2)
+        # Encode in one shot (orjson when available) and write the bytes
+        # through a large buffer rather than streaming through json.dump
+        if orjson is not None:
+            data = orjson.dumps(domains, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(domains, indent=2).encode('utf-8')
+        with open(filename, 'wb', buffering=262144) as f:
+            f.write(data)
         logger.info(f"Saved {len(domains)} domains to {filename}")
     except Exception as e:
         logger.error(f"Error saving JSON: {e}")
@@ -263,13 +295,14 @@ def main():
         logger.info("SUMMARY")
         logger.info("=" * 60)
         logger.info(f"Total domains found: {len(domains)}")
-        avg_price = sum(d['price'] for d in domains) / len(domains)
+        prices = [d['price'] for d in domains]
+        avg_price = sum(prices) / len(prices)
         logger.info(f"Average price: ${avg_price:.2f}")
-        logger.info(f"Price range: ${min(d['price'] for d in domains):.2f} - ${max(d['price'] for d in domains):.2f}")
+        logger.info(f"Price range: ${min(prices):.2f} - ${max(prices):.2f}")
         logger.info("=" * 60)
         logger.info("\nTop 5 cheapest domains:")
-        sorted_domains = sorted(domains, key=lambda x: x['price'])[:5]
-        for domain in sorted_domains:
+        cheapest_domains = heapq.nsmallest(5, domains, key=lambda x: x['price'])
+        for domain in cheapest_domains:
             logger.info(f"  {domain['domain']:30} ${domain['price']:.2f}")
     else:
         logger.warning("No domains found matching criteria")